@@ -2,20 +2,24 @@
 
 Config is JSON only, to keep things dependency-free on Python 3.10+.
 
-When no config file is found, medit will try to create a default config in the
-user config directory. If that fails, medit falls back to defaults and continues.
+Nothing is loaded at import time. The resolved config is materialized on first
+access (via get_config_result() or the lazy CONFIG / CONFIG_RESULT module
+attributes) and cached. When no config file is found, medit uses the defaults.
+No code path in medit creates a config file; write_default_config() can be used
+to write one explicitly.
 """
 
+import functools
 import json
 import os
+import stat
 import sys
-from dataclasses import asdict, dataclass, field, fields, is_dataclass
+from dataclasses import dataclass, field, fields, is_dataclass
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Callable, Mapping
 
 from .config_validators import FieldValidator, validate_string
 
-
 class ConfigError(Exception):
     """Raised when a config file exists but cannot be parsed/validated."""
 
@@ -54,23 +58,94 @@ class ConfigResult:
     diagnostics: ConfigDiagnostics
 
 
+# (option_name, field_name, validators). Defaults are not stored here: they are
+# read from a fresh section instance per call, so default_factory values are
+# never shared between results.
+_OptionSchema = tuple[str, str, tuple[FieldValidator, ...]]
+# (section_name, section_cls, allowed_keys, options)
+_SectionSchema = tuple[str, type, frozenset[str], tuple[_OptionSchema, ...]]
+
+
+def _field_validators(option_field: Any) -> tuple[FieldValidator, ...]:
+    validators = option_field.metadata.get("validators")
+    if validators is not None:
+        return tuple(validators)
+    validator = option_field.metadata.get("validator")
+    if validator is not None:
+        return (validator,)
+    return ()
+
+
+def _build_schema() -> tuple[_SectionSchema, ...]:
+    """Flatten the MeditConfig dataclasses into a tuple walked by validate_config."""
+
+    default_config = MeditConfig()
+    schema: list[_SectionSchema] = []
+    for section_field in fields(MeditConfig):
+        section_name = section_field.name
+        default_section = getattr(default_config, section_name)
+        if not is_dataclass(default_section):
+            raise ConfigError(
+                f"Internal error: config field '{section_name}' must be a dataclass."
+            )
+
+        section_cls = type(default_section)
+        section_fields = fields(section_cls)
+        options = tuple(
+            (
+                option_field.name,
+                f"{section_name}.{option_field.name}",
+                _field_validators(option_field),
+            )
+            for option_field in section_fields
+        )
+        schema.append(
+            (
+                section_name,
+                section_cls,
+                frozenset(f.name for f in section_fields),
+                options,
+            )
+        )
+    return tuple(schema)
+
+
+_SCHEMA = _build_schema()
+_ALLOWED_ROOT_KEYS = frozenset(section[0] for section in _SCHEMA)
+
 _CACHED_RESULT: ConfigResult | None = None
 
 
+_PLATFORM = sys.platform
+
+
+def _windows_config_dir(app_name: str) -> Path:
+    base = os.getenv("APPDATA") or os.getenv("LOCALAPPDATA")
+    if base:
+        return Path(base) / app_name
+    return Path.home() / "AppData" / "Roaming" / app_name
+
+
+def _macos_config_dir(app_name: str) -> Path:
+    return Path.home() / "Library" / "Application Support" / app_name
+
+
+def _xdg_config_dir(app_name: str) -> Path:
+    base = os.getenv("XDG_CONFIG_HOME")
+    if base:
+        return Path(base) / app_name
+    return Path.home() / ".config" / app_name
+
+
+_CONFIG_DIR_RESOLVERS = {
+    "win32": _windows_config_dir,
+    "darwin": _macos_config_dir,
+}
+
+
+@functools.lru_cache(maxsize=4)
 def _user_config_dir(app_name: str) -> Path:
-    match sys.platform:
-        case "win32":
-            base = os.getenv("APPDATA") or os.getenv("LOCALAPPDATA")
-            if base:
-                return Path(base) / app_name
-            return Path.home() / "AppData" / "Roaming" / app_name
-        case "darwin":
-            return Path.home() / "Library" / "Application Support" / app_name
-        case _:
-            base = os.getenv("XDG_CONFIG_HOME")
-            if base:
-                return Path(base) / app_name
-            return Path.home() / ".config" / app_name
+    return _CONFIG_DIR_RESOLVERS.get(_PLATFORM, _xdg_config_dir)(app_name)
 
 
 def _expand_path(raw: str) -> Path:
@@ -85,13 +160,17 @@ def _env_config_path() -> Path | None:
     return _expand_path(raw)
 
 
-def config_search_paths() -> list[Path]:
-    """Return config paths in the order they should be considered."""
+def config_search_paths(cwd: Path | None = None) -> list[Path]:
+    """Return config paths in the order they should be considered.
+
+    `cwd` defaults to the current working directory.
+    """
 
     paths: list[Path] = []
 
     # Local (project) config.
-    cwd = Path.cwd()
+    if cwd is None:
+        cwd = Path.cwd()
     paths.extend(
         [
             cwd / "medit.json",
@@ -111,10 +190,21 @@ def default_config_path() -> Path:
 
 
 def default_config_data() -> dict[str, Any]:
-    return asdict(MeditConfig())
+    # Built from the schema rather than asdict(); each section is a fresh
+    # instance, so mutable defaults are not shared between calls.
+    data: dict[str, Any] = {}
+    for section_name, section_cls, _, options in _SCHEMA:
+        default_section = section_cls()
+        data[section_name] = {
+            option_name: getattr(default_section, option_name)
+            for option_name, _, _ in options
+        }
+    return data
 
 
+@functools.cache
 def default_config_text() -> str:
+    # The defaults are immutable, so serialize them once, on first use.
     return json.dumps(default_config_data(), indent=2, sort_keys=True) + "\n"
 
 
@@ -123,16 +213,28 @@ def write_default_config(path: Path) -> None:
     path.write_text(default_config_text(), encoding="utf-8")
 
 
+def _is_regular_file(path: Path) -> bool:
+    # A single os.stat; equivalent to Path.is_file() without the wrapper.
+    try:
+        st = os.stat(str(path))
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode)
+
+
+def _first_regular_file(paths: list[Path]) -> Path | None:
+    for path in paths:
+        if _is_regular_file(path):
+            return path
+    return None
+
+
 def discover_config_path() -> Path | None:
     env_path = _env_config_path()
     if env_path is not None:
         return env_path
 
-    for path in config_search_paths():
-        if path.is_file():
-            return path
-
-    return None
+    return _first_regular_file(config_search_paths())
 
 
 def _load_json(path: Path) -> dict[str, Any]:
@@ -152,45 +254,78 @@ def _load_raw_config(path: Path) -> dict[str, Any]:
     return _load_json(path)
 
 
+def _check_bool(value: Any, *, path: Path | None, field_name: str) -> bool:
+    if isinstance(value, bool):
+        return value
+    raise ConfigError(f"{field_name} must be a boolean.", path=path)
+
+
+def _check_int(value: Any, *, path: Path | None, field_name: str) -> int:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    raise ConfigError(f"{field_name} must be an integer.", path=path)
+
+
+def _check_float(value: Any, *, path: Path | None, field_name: str) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    raise ConfigError(f"{field_name} must be a number.", path=path)
+
+
+def _check_str(value: Any, *, path: Path | None, field_name: str) -> str:
+    if isinstance(value, str):
+        return value
+    raise ConfigError(f"{field_name} must be a string.", path=path)
+
+
+def _check_list(value: Any, *, path: Path | None, field_name: str) -> list[Any]:
+    if isinstance(value, list):
+        return value
+    raise ConfigError(f"{field_name} must be a list.", path=path)
+
+
+def _check_tuple(value: Any, *, path: Path | None, field_name: str) -> tuple[Any, ...]:
+    if isinstance(value, list):
+        return tuple(value)
+    if isinstance(value, tuple):
+        return value
+    raise ConfigError(f"{field_name} must be a list.", path=path)
+
+
+def _check_dict(value: Any, *, path: Path | None, field_name: str) -> dict[str, Any]:
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise ConfigError(f"{field_name} must be an object.", path=path)
+
+
+# Keyed on the exact type of the default. Order matters for the isinstance
+# fallback used with subclasses: bool must come before int.
+_CHECKS_BY_TYPE: dict[type, Callable[..., Any]] = {
+    bool: _check_bool,
+    int: _check_int,
+    float: _check_float,
+    str: _check_str,
+    list: _check_list,
+    tuple: _check_tuple,
+    dict: _check_dict,
+}
+
+
 def _validate_like_default(
     value: Any, default: Any, *, path: Path | None, field_name: str
 ) -> Any:
     if value is None:
         return default
 
-    match default:
-        case bool():
-            if isinstance(value, bool):
-                return value
-            raise ConfigError(f"{field_name} must be a boolean.", path=path)
-        case int():
-            if isinstance(value, int) and not isinstance(value, bool):
-                return value
-            raise ConfigError(f"{field_name} must be an integer.", path=path)
-        case float():
-            if isinstance(value, (int, float)) and not isinstance(value, bool):
-                return float(value)
-            raise ConfigError(f"{field_name} must be a number.", path=path)
-        case str():
-            if isinstance(value, str):
-                return value
-            raise ConfigError(f"{field_name} must be a string.", path=path)
-        case list():
-            if isinstance(value, list):
-                return value
-            raise ConfigError(f"{field_name} must be a list.", path=path)
-        case tuple():
-            if isinstance(value, list):
-                return tuple(value)
-            if isinstance(value, tuple):
-                return value
-            raise ConfigError(f"{field_name} must be a list.", path=path)
-        case dict():
-            if isinstance(value, Mapping):
-                return dict(value)
-            raise ConfigError(f"{field_name} must be an object.", path=path)
-        case _:
+    check = _CHECKS_BY_TYPE.get(type(default))
+    if check is None:
+        for cls, candidate in _CHECKS_BY_TYPE.items():
+            if isinstance(default, cls):
+                check = candidate
+                break
+        else:
             return value
+    return check(value, path=path, field_name=field_name)
 
 
 def validate_config(data: Mapping[str, Any], *, path: Path | None = None) -> ConfigResult:
@@ -201,22 +336,14 @@ def validate_config(data: Mapping[str, Any], *, path: Path | None = None) -> Con
     if not isinstance(data, Mapping):
         raise ConfigError("Config root must be a table/object.", path=path)
 
-    default_config = MeditConfig()
-    allowed_root_keys = {f.name for f in fields(MeditConfig)}
-    unknown_root_keys = sorted(set(data.keys()) - allowed_root_keys)
+    unknown_root_keys = [key for key in data if key not in _ALLOWED_ROOT_KEYS]
     if unknown_root_keys:
-        warnings.append(f"Unknown top-level keys: {', '.join(unknown_root_keys)}")
+        warnings.append(
+            f"Unknown top-level keys: {', '.join(sorted(unknown_root_keys))}"
+        )
 
     built_sections: dict[str, Any] = {}
-    for section_field in fields(MeditConfig):
-        section_name = section_field.name
-        default_section = getattr(default_config, section_name)
-        if not is_dataclass(default_section):
-            raise ConfigError(
-                f"Internal error: config field '{section_name}' must be a dataclass.",
-                path=path,
-            )
-
+    for section_name, section_cls, allowed_section_keys, options in _SCHEMA:
         section_data = data.get(section_name, {})
         if section_data is None:
             section_data = {}
@@ -226,29 +353,21 @@ def validate_config(data: Mapping[str, Any], *, path: Path | None = None) -> Con
                 path=path,
             )
 
-        allowed_section_keys = {f.name for f in fields(type(default_section))}
-        unknown_section_keys = sorted(set(section_data.keys()) - allowed_section_keys)
+        default_section = section_cls()
+        unknown_section_keys = [
+            key for key in section_data if key not in allowed_section_keys
+        ]
         if unknown_section_keys:
             warnings.append(
-                f"Unknown [{section_name}] keys: {', '.join(unknown_section_keys)}"
+                f"Unknown [{section_name}] keys: "
+                f"{', '.join(sorted(unknown_section_keys))}"
             )
 
         section_kwargs: dict[str, Any] = {}
-        for option_field in fields(type(default_section)):
-            option_name = option_field.name
-            field_name = f"{section_name}.{option_name}"
+        for option_name, field_name, field_validators in options:
             default_value = getattr(default_section, option_name)
             raw_value = section_data.get(option_name, default_value)
 
-            field_validators: tuple[FieldValidator, ...] = ()
-            validators = option_field.metadata.get("validators")
-            if validators is not None:
-                field_validators = tuple(validators)
-            else:
-                validator = option_field.metadata.get("validator")
-                if validator is not None:
-                    field_validators = (validator,)
-
             if field_validators:
                 value: Any = raw_value
                 for validator in field_validators:
@@ -272,7 +391,7 @@ def validate_config(data: Mapping[str, Any], *, path: Path | None = None) -> Con
                     field_name=field_name,
                 )
 
-        built_sections[section_name] = type(default_section)(**section_kwargs)
+        built_sections[section_name] = section_cls(**section_kwargs)
 
     config = MeditConfig(**built_sections)
     return ConfigResult(
@@ -294,32 +413,27 @@ def get_config_result() -> ConfigResult:
         return _CACHED_RESULT
 
     env_path = _env_config_path()
-    if env_path is not None and not env_path.is_file():
-        _CACHED_RESULT = ConfigResult(
-            config=MeditConfig(),
-            diagnostics=ConfigDiagnostics(
-                path=env_path,
-                error=f"Config file from $MEDIT_CONFIG not found: {env_path}",
-            ),
-        )
-        return _CACHED_RESULT
-
-    config_path = discover_config_path()
-    if config_path is None:
-        # No config exists yet: try to create a default one in the user config dir.
-        default_path = default_config_path()
-        try:
-            write_default_config(default_path)
-            config_path = default_path
-        except OSError as exc:
+    if env_path is not None:
+        if not _is_regular_file(env_path):
             _CACHED_RESULT = ConfigResult(
                 config=MeditConfig(),
                 diagnostics=ConfigDiagnostics(
-                    path=default_path,
-                    error=f"Failed to create default config: {exc}",
+                    path=env_path,
+                    error=f"Config file from $MEDIT_CONFIG not found: {env_path}",
                 ),
             )
             return _CACHED_RESULT
+        config_path: Path | None = env_path
+    else:
+        config_path = _first_regular_file(config_search_paths())
+
+    if config_path is None:
+        # No config exists: run with defaults, without creating any files.
+        _CACHED_RESULT = ConfigResult(
+            config=MeditConfig(),
+            diagnostics=ConfigDiagnostics(),
+        )
+        return _CACHED_RESULT
 
     try:
         _CACHED_RESULT = load_config(config_path)
@@ -342,3 +456,13 @@ def get_config() -> MeditConfig:
 def clear_config_cache() -> None:
     global _CACHED_RESULT
     _CACHED_RESULT = None
+    _user_config_dir.cache_clear()
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy module attributes: the config is only loaded when first requested.
+    if name == "CONFIG":
+        return get_config()
+    if name == "CONFIG_RESULT":
+        return get_config_result()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
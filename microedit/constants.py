@@ -9,9 +9,6 @@ from .config import get_config_result
 
 VERSION = "1.1.1"
 
-CONFIG_RESULT = get_config_result()
-COMMAND_SEPARATOR_CHAR = CONFIG_RESULT.config.commands.separator
-
 LOG_DIR: str
 
 match sys.platform:
@@ -34,3 +31,13 @@ os.makedirs(os.path.dirname(LOG_DIR), exist_ok=True)
 LOG = LogNode(
     "medit", print_filter=[Fatal, Info], print_to_console=True, log_file=LOG_DIR
 )
+
+
+def __getattr__(name: str):
+    # Config-derived constants are resolved lazily so importing this module
+    # does not load the config file.
+    if name == "CONFIG_RESULT":
+        return get_config_result()
+    if name == "COMMAND_SEPARATOR_CHAR":
+        return get_config_result().config.commands.separator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
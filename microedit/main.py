@@ -6,7 +6,8 @@ import os
 from objlog.LogMessages import Debug, Info, Warn, Error
 
 from .classes import Line, File, EditCommandResult
-from .constants import LOG_DIR, LOG, VERSION, COMMAND_SEPARATOR_CHAR, CONFIG_RESULT
+from .config import CommandsConfig, get_config, get_config_result
+from .constants import LOG_DIR, LOG, VERSION
 
 from .commands import execute_command
 
@@ -90,8 +91,9 @@ def run_commands(
     """Run a series of commands on the file."""
 
     last_feedback = None
+    separator = get_config().commands.separator
 
-    for command in commands.split(COMMAND_SEPARATOR_CHAR):
+    for command in commands.split(separator):
         command = command.strip()
         # prune empty commands
         if len(command) == 0:
@@ -139,22 +141,24 @@ def main():
     parser.add_argument(
         "-c",
         "--command",
-        help=f"Command(s) to run on the file, separated by '{COMMAND_SEPARATOR_CHAR}'. NOTE: all arguments after -c are considered part of the command.",
+        help=f"Command(s) to run on the file, separated by the configured command separator (default '{CommandsConfig.separator}'). NOTE: all arguments after -c are considered part of the command.",
         nargs=argparse.REMAINDER,
     )
     args = parser.parse_args()
 
     LOG.log(Debug(f"Arguments: {args}"))
 
-    if CONFIG_RESULT.diagnostics.error:
+    config_result = get_config_result()
+
+    if config_result.diagnostics.error:
         LOG.log(
             Warn(
-                f"Config error ({CONFIG_RESULT.diagnostics.path}): "
-                f"{CONFIG_RESULT.diagnostics.error}. Using defaults."
+                f"Config error ({config_result.diagnostics.path}): "
+                f"{config_result.diagnostics.error}. Using defaults."
             )
         )
-    for warning in CONFIG_RESULT.diagnostics.warnings:
-        LOG.log(Warn(f"Config warning ({CONFIG_RESULT.diagnostics.path}): {warning}"))
+    for warning in config_result.diagnostics.warnings:
+        LOG.log(Warn(f"Config warning ({config_result.diagnostics.path}): {warning}"))
 
     if args.command:
         command_str = " ".join(args.command).strip()